@@ -0,0 +1,22 @@
+"""
+Shared event loop startup for the example scripts
+"""
+
+import asyncio
+
+async def _boot(entry):
+    """Run entry() with eager task execution where supported (Python 3.12+)"""
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    await entry()
+
+def run(entry):
+    """Run entry() on a fresh event loop"""
+    # uvloop is optional; it lowers per-task scheduling overhead when installed.
+    # uvloop.run() replaces the uvloop.install() policy hook deprecated on 3.12+
+    try:
+        from uvloop import run as loop_run
+    except ImportError:
+        loop_run = asyncio.run
+    loop_run(_boot(entry))
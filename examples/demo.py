@@ -8,10 +8,49 @@ This script will discover your controllers and set them to green at 50%.
 
 import asyncio
 import logging
-from triones import discover_controllers
+from triones import discover_controllers, rgb_command
+try:
+    from examples._runner import run
+except ImportError:
+    # Run as a script: the sibling module is on sys.path
+    from _runner import run
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+# Set up logging (warnings only, so library INFO logs don't slow the color loops)
+logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
+
+async def _connect(controller, connected):
+    """Connect a single controller, adding it to connected as soon as it succeeds"""
+    print(f"   Connecting to {controller.name}...")
+    ok = await controller.connect()
+    if ok:
+        connected.append(controller)
+        print(f"   ✅ Connected to {controller.name}!")
+    else:
+        print(f"   ❌ Failed to connect to {controller.name}")
+    return ok
+
+async def _pipelined(limit, func, *args):
+    """Run func(*args) once a slot in the controller's write pipeline is free"""
+    async with limit:
+        return await func(*args)
+
+async def _on_then_color(controller, frame):
+    """Power a controller on, then send it a color frame"""
+    await controller.power_on()
+    return await controller.write_raw(frame)
+
+async def _status(limit, controller):
+    """Read a controller's status once a slot in the pool is free"""
+    async with limit:
+        return controller, await controller.get_status()
+
+async def _fanout(funcs, *args):
+    """Call every func(*args) concurrently and collect the results"""
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        *[loop.create_task(func(*args)) for func in funcs],
+        return_exceptions=True
+    )
 
 async def demo():
     """Demonstrate the Triones module by setting controllers to green"""
@@ -20,6 +59,11 @@ async def demo():
     print("This demo will set all your Triones controllers to green at 50%")
     print()
     
+    loop = asyncio.get_running_loop()
+    # Filled as each connect succeeds, so an interrupted connect phase still
+    # disconnects whatever did connect
+    connected = []
+    
     try:
         # Discover controllers
         print("🔍 Discovering Triones controllers...")
@@ -33,59 +77,62 @@ async def demo():
             print("   - Within Bluetooth range")
             return
         
-        print(f"✅ Found {len(controllers)} controller(s):")
-        for i, controller in enumerate(controllers, 1):
-            print(f"   {i}. {controller.name} ({controller.address})")
+        # Emit each phase's per-controller lines in one write
+        lines = [f"✅ Found {len(controllers)} controller(s):"]
+        lines.extend(
+            f"   {i}. {controller.name} ({controller.address})"
+            for i, controller in enumerate(controllers, 1)
+        )
+        print("\n".join(lines))
         
         # Connect to all controllers
         print(f"\n🔗 Connecting to controllers...")
-        connected = []
-        for controller in controllers:
-            print(f"   Connecting to {controller.name}...")
-            if await controller.connect():
-                connected.append(controller)
-                print(f"   ✅ Connected!")
-            else:
-                print(f"   ❌ Failed to connect")
+        await asyncio.gather(
+            *(_connect(controller, connected) for controller in controllers),
+            return_exceptions=True
+        )
         
         if not connected:
             print("❌ Could not connect to any controllers")
             return
         
         print(f"✅ Connected to {len(connected)} controller(s)")
+        write_fns = tuple(controller.write_raw for controller in connected)
+        
+        # Status reads go through a bounded pool; the adapter only handles
+        # a few concurrent GATT operations
+        status_limit = asyncio.Semaphore(4)
         
         # Get current status
         print(f"\n📊 Current controller status:")
-        for controller in connected:
-            status = await controller.get_status()
+        pairs = await asyncio.gather(*(_status(status_limit, c) for c in connected))
+        lines = []
+        for controller, status in pairs:
             if status:
-                print(f"   {controller.name}:")
-                print(f"     Power: {'ON' if status.is_on else 'OFF'}")
-                print(f"     RGB: {status.rgb_tuple} ({status.rgb_hex})")
-                print(f"     Mode: {status.mode}")
-        
-        # Turn all controllers on
+                lines.append(f"   {controller.name}:")
+                lines.append(f"     Power: {'ON' if status.is_on else 'OFF'}")
+                lines.append(f"     RGB: {status.rgb_tuple} ({status.rgb_hex})")
+                lines.append(f"     Mode: {status.mode}")
+        if lines:
+            print("\n".join(lines))
+        
+        # Turn all controllers on and set them to green at 50% (RGB: 0, 127, 0)
         print(f"\n🔌 Ensuring all controllers are powered on...")
-        for controller in connected:
-            await controller.power_on()
-        
-        await asyncio.sleep(1)
-        
-        # Set all controllers to green at 50% (RGB: 0, 127, 0)
         print(f"\n🟢 Setting all controllers to GREEN at 50%...")
         print(f"   Target RGB: (0, 127, 0) = #007F00")
         
         # Send commands simultaneously for synchronization
+        green = rgb_command(0, 127, 0)
         tasks = []
         for controller in connected:
-            task = controller.set_rgb(0, 127, 0)
+            task = loop.create_task(_on_then_color(controller, green))
             tasks.append(task)
         
         # Execute all commands at once
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Check results
-        success_count = sum(1 for result in results if result is True)
+        success_count = results.count(True)
         print(f"   ✅ {success_count}/{len(connected)} controllers updated successfully")
         
         # Wait and verify the changes
@@ -93,14 +140,17 @@ async def demo():
         
         print(f"\n✅ Verifying color changes...")
         all_correct = True
-        for controller in connected:
-            status = await controller.get_status()
+        pairs = await asyncio.gather(*(_status(status_limit, c) for c in connected))
+        lines = []
+        for controller, status in pairs:
             if status:
                 if status.red == 0 and status.green == 127 and status.blue == 0:
-                    print(f"   ✅ {controller.name}: {status.rgb_hex} - Correct!")
+                    lines.append(f"   ✅ {controller.name}: {status.rgb_hex} - Correct!")
                 else:
-                    print(f"   ⚠️  {controller.name}: {status.rgb_hex} - Different color")
+                    lines.append(f"   ⚠️  {controller.name}: {status.rgb_hex} - Different color")
                     all_correct = False
+        if lines:
+            print("\n".join(lines))
         
         if all_correct:
             print(f"\n🎉 SUCCESS! All controllers are now GREEN at 50%")
@@ -116,16 +166,22 @@ async def demo():
             (0, 255, 255, "Cyan")
         ]
         
+        # Keep at most two writes in flight per controller so the next color
+        # is queued without waiting for the previous write to complete
+        limits = tuple(asyncio.Semaphore(2) for _ in connected)
+        pending = []
         for r, g, b, name in colors:
             print(f"   Setting to {name}...")
-            tasks = [controller.set_rgb(r, g, b) for controller in connected]
-            await asyncio.gather(*tasks)
+            frame = rgb_command(r, g, b)
+            pending[:] = [t for t in pending if not t.done()]
+            for limit, write in zip(limits, write_fns):
+                pending.append(loop.create_task(_pipelined(limit, write, frame)))
             await asyncio.sleep(2)
+        await asyncio.gather(*pending, return_exceptions=True)
         
         # Return to green
         print(f"   Returning to GREEN...")
-        tasks = [controller.set_rgb(0, 127, 0) for controller in connected]
-        await asyncio.gather(*tasks)
+        await _fanout(write_fns, green)
         
         print(f"\n🎉 Demo completed successfully!")
         
@@ -140,20 +196,41 @@ async def demo():
     finally:
         # Cleanup - disconnect all controllers
         print(f"\n🔌 Disconnecting controllers...")
-        if 'connected' in locals():
-            for controller in connected:
-                try:
-                    await controller.disconnect()
-                    print(f"   Disconnected from {controller.name}")
-                except:
-                    pass
+        if connected:
+            await asyncio.gather(
+                *(_safe_disconnect(controller) for controller in connected),
+                return_exceptions=True
+            )
         
         print(f"✅ Demo finished!")
 
+async def _safe_disconnect(controller):
+    """Disconnect a single controller, ignoring teardown errors"""
+    try:
+        await controller.disconnect()
+        print(f"   Disconnected from {controller.name}")
+    except Exception:
+        pass
+
+async def run_all():
+    """Run the color demo and then the temperature demo on one event loop"""
+    try:
+        from examples.temperature_demo import temperature_demo
+    except ImportError:
+        # Run as a script (python examples/demo.py): the sibling module is on sys.path
+        from temperature_demo import temperature_demo
+    await demo()
+    await temperature_demo()
+
 def main():
     """Entry point for console script"""
     print("Starting Triones Controller Demo...")
-    asyncio.run(demo())
+    run(demo)
+
+def main_all():
+    """Entry point for console script running every demo in one process"""
+    print("Starting all Triones Controller Demos...")
+    run(run_all)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,22 +9,35 @@ import asyncio
 import logging
 from triones import (
     discover_controllers, 
-    connect_by_name, 
     TrionesController, 
     TrionesMode,
-    TrionesScanner
+    TrionesScanner,
+    rgb_command
 )
+try:
+    from examples._runner import run
+except ImportError:
+    # Run as a script: the sibling module is on sys.path
+    from _runner import run
 
 # Enable debug logging to see what's happening
 logging.basicConfig(level=logging.INFO)
 
-async def basic_usage_example():
+# Status dump templates, filled in one formatting pass per status
+_STATUS_FMT = "  Power: %s\n  RGB: %s (%s)\n  White: %s\n  Mode: %s"
+_DETAILED_STATUS_FMT = (
+    "  Name: %s\n  Address: %s\n  Power: %s\n  RGB: %s (%s)\n"
+    "  RGBW: %s\n  Mode: %s\n  Speed: %s"
+)
+
+async def basic_usage_example(controllers=None):
     """Basic usage example - discover and control controllers"""
     print("🔍 Basic Usage Example")
     print("=" * 50)
     
-    # Discover all Triones controllers
-    controllers = await discover_controllers(timeout=10.0)
+    # Discover all Triones controllers (unless a shared scan was passed in)
+    if controllers is None:
+        controllers = await discover_controllers(timeout=10.0)
     
     if not controllers:
         print("❌ No Triones controllers found!")
@@ -45,10 +58,10 @@ async def basic_usage_example():
             print("\n📊 Getting current status...")
             status = await controller.get_status()
             if status:
-                print(f"  Power: {'ON' if status.is_on else 'OFF'}")
-                print(f"  RGB: {status.rgb_tuple} ({status.rgb_hex})")
-                print(f"  White: {status.white}")
-                print(f"  Mode: {status.mode}")
+                print(_STATUS_FMT % (
+                    "ON" if status.is_on else "OFF", status.rgb_tuple, status.rgb_hex,
+                    status.white, status.mode
+                ))
             
             # Turn on the controller
             print("\n🔌 Turning on...")
@@ -69,7 +82,7 @@ async def basic_usage_example():
             print("\n🎨 Cycling through colors...")
             for r, g, b, color_name in colors:
                 print(f"  Setting to {color_name} RGB({r}, {g}, {b})")
-                await controller.set_rgb(r, g, b)
+                await controller.write_raw(rgb_command(r, g, b))
                 await asyncio.sleep(2)
             
             # Set using hex colors
@@ -114,13 +127,29 @@ async def basic_usage_example():
         # Always disconnect
         await controller.disconnect()
 
-async def multiple_controllers_example():
+async def _connect(controller, connected):
+    """Connect a single controller, adding it to connected as soon as it succeeds"""
+    ok = await controller.connect()
+    if ok:
+        connected.append(controller)
+        print(f"  ✅ Connected to {controller.name}")
+    else:
+        print(f"  ❌ Failed to connect to {controller.name}")
+    return ok
+
+async def _pipelined(limit, func, *args):
+    """Run func(*args) once a slot in the controller's write pipeline is free"""
+    async with limit:
+        return await func(*args)
+
+async def multiple_controllers_example(controllers=None):
     """Example of controlling multiple controllers simultaneously"""
     print("\n🔍 Multiple Controllers Example")
     print("=" * 50)
     
-    # Discover controllers
-    controllers = await discover_controllers()
+    # Discover controllers (unless a shared scan was passed in)
+    if controllers is None:
+        controllers = await discover_controllers()
     
     if len(controllers) < 2:
         print("⚠️  Need at least 2 controllers for this example")
@@ -128,17 +157,18 @@ async def multiple_controllers_example():
     
     print(f"✅ Found {len(controllers)} controllers")
     
+    loop = asyncio.get_running_loop()
+    # Filled as each connect succeeds, so an interrupted connect phase still
+    # disconnects whatever did connect
+    connected_controllers = []
+    
     try:
         # Connect to all controllers
         print("\n🔗 Connecting to all controllers...")
-        connected_controllers = []
-        
-        for controller in controllers:
-            if await controller.connect():
-                connected_controllers.append(controller)
-                print(f"  ✅ Connected to {controller.name}")
-            else:
-                print(f"  ❌ Failed to connect to {controller.name}")
+        await asyncio.gather(
+            *(_connect(controller, connected_controllers) for controller in controllers),
+            return_exceptions=True
+        )
         
         if len(connected_controllers) < 2:
             print("❌ Need at least 2 connected controllers")
@@ -146,8 +176,7 @@ async def multiple_controllers_example():
         
         # Turn all on
         print("\n🔌 Turning all controllers on...")
-        for controller in connected_controllers:
-            await controller.power_on()
+        await asyncio.gather(*(controller.power_on() for controller in connected_controllers))
         
         await asyncio.sleep(1)
         
@@ -164,7 +193,7 @@ async def multiple_controllers_example():
         tasks = []
         for i, controller in enumerate(connected_controllers):
             color = colors[i % len(colors)]
-            task = controller.set_rgb(*color)
+            task = loop.create_task(controller.set_rgb(*color))
             tasks.append(task)
         
         # Execute all color changes simultaneously
@@ -175,11 +204,18 @@ async def multiple_controllers_example():
         
         # Synchronized color cycling
         print("\n🔄 Synchronized color cycling...")
+        limits = {controller: asyncio.Semaphore(2) for controller in connected_controllers}
+        pending = []
         for r, g, b, name in [(255,0,0,"Red"), (0,255,0,"Green"), (0,0,255,"Blue")]:
             print(f"  All controllers -> {name}")
-            tasks = [controller.set_rgb(r, g, b) for controller in connected_controllers]
-            await asyncio.gather(*tasks)
+            frame = rgb_command(r, g, b)
+            pending[:] = [t for t in pending if not t.done()]
+            for controller in connected_controllers:
+                pending.append(loop.create_task(
+                    _pipelined(limits[controller], controller.write_raw, frame)
+                ))
             await asyncio.sleep(2)
+        await asyncio.gather(*pending, return_exceptions=True)
     
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -187,10 +223,12 @@ async def multiple_controllers_example():
     finally:
         # Disconnect all controllers
         print("\n🔌 Disconnecting all controllers...")
-        for controller in connected_controllers:
-            await controller.disconnect()
+        await asyncio.gather(
+            *(controller.disconnect() for controller in connected_controllers),
+            return_exceptions=True
+        )
 
-async def specific_controller_example():
+async def specific_controller_example(controllers=None):
     """Example of connecting to a specific controller by name"""
     print("\n🔍 Specific Controller Example")
     print("=" * 50)
@@ -199,11 +237,17 @@ async def specific_controller_example():
     # Replace with your actual controller name
     target_names = ["Triones:1205110001A0", "Triones:2205110002B3"]
     
+    # Look every target up in a single scan rather than scanning once per name
+    if controllers is None:
+        controllers = await discover_controllers(timeout=5.0)
+    by_name = {c.name: c for c in controllers}
+    
     controller = None
     for name in target_names:
         print(f"🔍 Looking for controller: {name}")
-        controller = await connect_by_name(name, timeout=5.0)
-        if controller:
+        candidate = by_name.get(name)
+        if candidate and await candidate.connect():
+            controller = candidate
             print(f"✅ Found and connected to {name}")
             break
         else:
@@ -218,13 +262,10 @@ async def specific_controller_example():
         status = await controller.get_status()
         if status:
             print(f"\n📊 Controller Status:")
-            print(f"  Name: {controller.name}")
-            print(f"  Address: {controller.address}")
-            print(f"  Power: {'ON' if status.is_on else 'OFF'}")
-            print(f"  RGB: {status.rgb_tuple} ({status.rgb_hex})")
-            print(f"  RGBW: {status.rgbw_tuple}")
-            print(f"  Mode: {status.mode}")
-            print(f"  Speed: {status.speed}")
+            print(_DETAILED_STATUS_FMT % (
+                controller.name, controller.address, "ON" if status.is_on else "OFF",
+                status.rgb_tuple, status.rgb_hex, status.rgbw_tuple, status.mode, status.speed
+            ))
         
         # Set to a nice purple color
         print(f"\n🟣 Setting to purple...")
@@ -247,16 +288,20 @@ async def main():
     print("🎮 Triones Controller Module Examples")
     print("=" * 60)
     
+    # Scan once and share the results; every example disconnects when done,
+    # so the same controllers can be reconnected by the next one
+    controllers = await discover_controllers(timeout=10.0)
+    
     # Run examples
-    await basic_usage_example()
+    await basic_usage_example(controllers)
     await asyncio.sleep(2)
     
-    await multiple_controllers_example()
+    await multiple_controllers_example(controllers)
     await asyncio.sleep(2)
     
-    await specific_controller_example()
+    await specific_controller_example(controllers)
     
     print("\n🎉 All examples completed!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main)
\ No newline at end of file
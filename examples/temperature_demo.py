@@ -8,10 +8,60 @@ This script will cycle through various color temperatures to show the RGBW tempe
 
 import asyncio
 import logging
-from triones import discover_controllers
+from triones import discover_controllers, temperature_command
+try:
+    from examples._runner import run
+except ImportError:
+    # Run as a script: the sibling module is on sys.path
+    from _runner import run
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+# Set up logging (warnings only, so library INFO logs don't slow the color loops)
+logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
+
+# Temperature presets with their command frames built once at import
+_TEMP_PRESETS = tuple(
+    (temp, description, temperature_command(temp, brightness=0.8))
+    for temp, description in (
+        (1000, "🕯️  Deep warm amber (candlelight)"),
+        (2000, "🕯️  Candlelight"),
+        (2700, "💡 Warm white (incandescent)"),
+        (3000, "💡 Warm white (halogen)"),
+        (4000, "🏠 Cool white (office)"),
+        (5000, "☀️  Daylight"),
+        (6500, "☀️  Cool daylight"),
+        (8000, "🌤️  Overcast sky"),
+        (10000, "🔵 Blue sky")
+    )
+)
+
+# Smooth transition from 2000K to 8000K in 500K steps
+_SMOOTH = tuple(
+    (temp, temperature_command(temp, brightness=0.7))
+    for temp in range(2000, 8001, 500)
+)
+
+async def _connect(controller, connected):
+    """Connect a single controller, adding it to connected as soon as it succeeds"""
+    print(f"   Connecting to {controller.name}...")
+    ok = await controller.connect()
+    if ok:
+        connected.append(controller)
+        print(f"   ✅ Connected to {controller.name}!")
+    else:
+        print(f"   ❌ Failed to connect to {controller.name}")
+    return ok
+
+async def _fanout(funcs, *args):
+    """Call every func(*args) concurrently and collect the results"""
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        *[loop.create_task(func(*args)) for func in funcs],
+        return_exceptions=True
+    )
+
+async def _sleep_until(deadline):
+    """Sleep until the event loop's monotonic clock reaches deadline"""
+    await asyncio.sleep(max(0, deadline - asyncio.get_running_loop().time()))
 
 async def temperature_demo():
     """Demonstrate the Triones temperature functionality"""
@@ -21,6 +71,11 @@ async def temperature_demo():
     print("using both RGB and white LEDs for maximum brightness and accurate reproduction")
     print()
     
+    loop = asyncio.get_running_loop()
+    # Filled as each connect succeeds, so an interrupted connect phase still
+    # disconnects whatever did connect
+    connected = []
+    
     try:
         # Discover controllers
         print("🔍 Discovering Triones controllers...")
@@ -34,75 +89,62 @@ async def temperature_demo():
             print("   - Within Bluetooth range")
             return
         
-        print(f"✅ Found {len(controllers)} controller(s):")
-        for i, controller in enumerate(controllers, 1):
-            print(f"   {i}. {controller.name} ({controller.address})")
+        # Emit each phase's per-controller lines in one write
+        lines = [f"✅ Found {len(controllers)} controller(s):"]
+        lines.extend(
+            f"   {i}. {controller.name} ({controller.address})"
+            for i, controller in enumerate(controllers, 1)
+        )
+        print("\n".join(lines))
         
         # Connect to all controllers
         print(f"\n🔗 Connecting to controllers...")
-        connected = []
-        for controller in controllers:
-            print(f"   Connecting to {controller.name}...")
-            if await controller.connect():
-                connected.append(controller)
-                print(f"   ✅ Connected!")
-            else:
-                print(f"   ❌ Failed to connect")
+        await asyncio.gather(
+            *(_connect(controller, connected) for controller in controllers),
+            return_exceptions=True
+        )
         
         if not connected:
             print("❌ Could not connect to any controllers")
             return
         
         print(f"✅ Connected to {len(connected)} controller(s)")
+        write_fns = tuple(controller.write_raw for controller in connected)
+        set_temp_fns = tuple(controller.set_temperature for controller in connected)
         
         # Turn all controllers on
         print(f"\n🔌 Ensuring all controllers are powered on...")
-        for controller in connected:
-            await controller.power_on()
+        await asyncio.gather(*(controller.power_on() for controller in connected))
         
         await asyncio.sleep(1)
         
-        # Define temperature demonstrations
-        temperatures = [
-            (1000, "🕯️  Deep warm amber (candlelight)"),
-            (2000, "🕯️  Candlelight"),
-            (2700, "💡 Warm white (incandescent)"),
-            (3000, "💡 Warm white (halogen)"),
-            (4000, "🏠 Cool white (office)"),
-            (5000, "☀️  Daylight"),
-            (6500, "☀️  Cool daylight"),
-            (8000, "🌤️  Overcast sky"),
-            (10000, "🔵 Blue sky")
-        ]
-        
         print(f"\n🌡️  Cycling through color temperatures...")
         print(f"Each temperature will be shown for 4 seconds")
         print()
         
-        for temp, description in temperatures:
+        # Pace steps against a monotonic deadline so the BLE writes overlap
+        # with the observation time instead of being added on top of it
+        deadline = loop.time()
+        for temp, description, frame in _TEMP_PRESETS:
+            deadline += 4.0
             print(f"Setting to {temp}K - {description}")
             
             # Send temperature commands simultaneously to all controllers
-            tasks = []
-            for controller in connected:
-                task = controller.set_temperature(temp, brightness=0.8)
-                tasks.append(task)
-            
-            # Execute all commands at once for synchronization
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await _fanout(write_fns, frame)
             
             # Check results
-            success_count = sum(1 for result in results if result is True)
+            success_count = results.count(True)
             print(f"   ✅ {success_count}/{len(connected)} controllers updated")
             
-            # Wait to observe the temperature
-            await asyncio.sleep(4)
+            # Wait out the rest of this step to observe the temperature
+            await _sleep_until(deadline)
         
         # Demonstrate brightness control at different temperatures
         print(f"\n💡 Demonstrating brightness control...")
         test_temps = [2700, 6500]  # Warm and cool
         brightnesses = [0.2, 0.5, 1.0]
         
+        deadline = loop.time()
         for temp in test_temps:
             temp_name = "Warm white" if temp == 2700 else "Cool daylight"
             print(f"\n{temp}K ({temp_name}) at different brightness levels:")
@@ -110,37 +152,23 @@ async def temperature_demo():
             for brightness in brightnesses:
                 print(f"   Setting brightness to {int(brightness * 100)}%...")
                 
-                tasks = []
-                for controller in connected:
-                    task = controller.set_temperature(temp, brightness=brightness)
-                    tasks.append(task)
-                
-                await asyncio.gather(*tasks, return_exceptions=True)
-                await asyncio.sleep(2)
+                deadline += 2.0
+                await _fanout(set_temp_fns, temp, brightness)
+                await _sleep_until(deadline)
         
         # Final demonstration - smooth temperature transition
         print(f"\n🌈 Smooth temperature transition (warm to cool)...")
-        temp_range = list(range(2000, 8001, 500))  # 2000K to 8000K in 500K steps
-        
-        for temp in temp_range:
+        deadline = loop.time()
+        for temp, frame in _SMOOTH:
+            deadline += 1.5
             print(f"   {temp}K...")
             
-            tasks = []
-            for controller in connected:
-                task = controller.set_temperature(temp, brightness=0.7)
-                tasks.append(task)
-            
-            await asyncio.gather(*tasks, return_exceptions=True)
-            await asyncio.sleep(1.5)
+            await _fanout(write_fns, frame)
+            await _sleep_until(deadline)
         
         # End with a pleasant daylight temperature
         print(f"\n✨ Finishing with comfortable 5000K daylight...")
-        tasks = []
-        for controller in connected:
-            task = controller.set_temperature(5000, brightness=0.6)
-            tasks.append(task)
-        
-        await asyncio.gather(*tasks, return_exceptions=True)
+        await _fanout(set_temp_fns, 5000, 0.6)
         
         print(f"\n🎉 Temperature demo completed successfully!")
         print(f"💡 Your controllers are now set to 5000K daylight at 60% brightness")
@@ -156,20 +184,26 @@ async def temperature_demo():
     finally:
         # Cleanup - disconnect all controllers
         print(f"\n🔌 Disconnecting controllers...")
-        if 'connected' in locals():
-            for controller in connected:
-                try:
-                    await controller.disconnect()
-                    print(f"   Disconnected from {controller.name}")
-                except:
-                    pass
+        if connected:
+            await asyncio.gather(
+                *(_safe_disconnect(controller) for controller in connected),
+                return_exceptions=True
+            )
         
         print(f"✅ Temperature demo finished!")
 
+async def _safe_disconnect(controller):
+    """Disconnect a single controller, ignoring teardown errors"""
+    try:
+        await controller.disconnect()
+        print(f"   Disconnected from {controller.name}")
+    except Exception:
+        pass
+
 def main():
     """Entry point for console script"""
     print("Starting Triones Color Temperature Demo...")
-    asyncio.run(temperature_demo())
+    run(temperature_demo)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
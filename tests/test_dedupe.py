@@ -0,0 +1,98 @@
+"""Tests for the set_temperature() duplicate-write window"""
+
+import asyncio
+import time
+import unittest
+
+from triones import TrionesController, temperature_command
+
+
+class FakeClient:
+    """Minimal stand-in for BleakClient that records writes"""
+
+    def __init__(self):
+        self.writes = []
+        self.fail = False
+        self.delay = 0.0
+
+    async def write_gatt_char(self, char, data, response=None):
+        if self.fail:
+            raise OSError("write failed")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.writes.append(bytes(data))
+
+
+class FakeDevice:
+    name = "Triones:TEST"
+    address = "AA:BB:CC:DD:EE:FF"
+
+
+class DedupeWindowTest(unittest.IsolatedAsyncioTestCase):
+    """set_temperature() skips identical frames inside DEDUPE_WINDOW, nothing else does"""
+
+    def setUp(self):
+        self.controller = TrionesController(FakeDevice(), auto_connect=False)
+        self.client = FakeClient()
+        self.controller._client = self.client
+        self.controller._connected = True
+        self.frame = temperature_command(3000)
+
+    async def test_repeated_setpoint_is_sent_once(self):
+        for _ in range(3):
+            self.assertTrue(await self.controller.set_temperature(3000))
+        self.assertEqual(self.client.writes, [self.frame])
+
+    async def test_setpoint_resent_after_window(self):
+        await self.controller.set_temperature(3000)
+        self.controller._last_command_time = time.monotonic() - self.controller.DEDUPE_WINDOW
+        await self.controller.set_temperature(3000)
+        self.assertEqual(self.client.writes, [self.frame, self.frame])
+
+    async def test_zero_window_disables_dedupe(self):
+        self.controller.DEDUPE_WINDOW = 0
+        await self.controller.set_temperature(3000)
+        await self.controller.set_temperature(3000)
+        self.assertEqual(len(self.client.writes), 2)
+
+    async def test_other_writes_are_never_deduplicated(self):
+        await self.controller.write_raw(self.frame)
+        await self.controller.write_raw(self.frame)
+        await self.controller.set_white(200)
+        await self.controller.set_white(200)
+        self.assertEqual(len(self.client.writes), 4)
+
+    async def test_power_transition_invalidates_setpoint(self):
+        await self.controller.set_temperature(3000)
+        await self.controller.power_off()
+        await self.controller.power_on()
+        await self.controller.set_temperature(3000)
+        self.assertEqual(self.client.writes[-1], self.frame)
+        self.assertEqual(len(self.client.writes), 4)
+
+    async def test_failed_power_write_still_invalidates_setpoint(self):
+        await self.controller.set_temperature(3000)
+        self.client.fail = True
+        self.assertFalse(await self.controller.power_off())
+        self.client.fail = False
+        await self.controller.set_temperature(3000)
+        self.assertEqual(self.client.writes, [self.frame, self.frame])
+
+    async def test_setpoint_not_skipped_while_another_write_is_in_flight(self):
+        await self.controller.set_temperature(3000)
+        self.client.delay = 0.02
+        red = asyncio.ensure_future(self.controller.set_rgb(255, 0, 0))
+        await asyncio.sleep(0)  # let the RGB write start
+        self.assertTrue(await self.controller.set_temperature(3000))
+        await red
+        self.assertEqual(self.client.writes[-1], self.frame)
+        self.assertEqual(len(self.client.writes), 3)
+
+    async def test_missing_write_characteristic_is_not_reported_as_success(self):
+        await self.controller.set_temperature(3000)
+        self.controller._write_char_present = False
+        self.assertFalse(await self.controller.set_temperature(3000))
+
+
+if __name__ == "__main__":
+    unittest.main()
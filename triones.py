@@ -9,10 +9,14 @@ License: MIT
 """
 
 import asyncio
+import functools
 import math
 import platform
-from typing import List, Tuple, Optional, Dict, Any
+import struct
+import time
+from typing import Callable, List, Tuple, Optional, Dict, Any, Union
 from bleak import BleakScanner, BleakClient
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.backends.device import BLEDevice
 import logging
 from dataclasses import dataclass
@@ -21,6 +25,39 @@ from enum import Enum
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Resolved once at import, saving a function call and string comparison on every write
+_IS_WINDOWS = platform.system() == "Windows"
+
+# A resolved characteristic handle, or its UUID when services aren't known
+_Characteristic = Union[BleakGATTCharacteristic, str]
+
+# Static command frames (official Triones protocol)
+_POWER_ON_CMD = bytes([0xCC, 0x23, 0x33])
+_POWER_OFF_CMD = bytes([0xCC, 0x24, 0x33])
+_STATUS_CMD = bytes([0xEF, 0x01, 0x77])
+_RGBW_OFF_CMD = bytes([0x56, 0x00, 0x00, 0x00, 0x00, 0xF0, 0xAA])
+
+# Variable command frame layouts, packed in one C call per frame
+# RGB: 56 RR GG BB 00 F0 AA / White: 56 00 00 00 WW 0F AA / Mode: BB MM SS 44
+_COLOR_FRAME = struct.Struct(">7B")
+_MODE_FRAME = struct.Struct(">4B")
+
+# Candidate magic bytes (frame byte 5) probed by TrionesController.test_rgbw_formats()
+_RGBW_TEST_MAGICS = (
+    (0xFF, "0xFF magic"),
+    (0xF0, "0xF0 magic (RGB-style)"),
+    (0x0F, "0x0F magic (White-style)"),
+    (0x00, "0x00 magic"),
+    (0xAA, "0xAA magic"),
+)
+
+# Advertised name prefixes (lowercase) that identify Triones controllers
+_TRIONES_NAME_PREFIXES = ("triones",)
+
+# Status response layout (12 bytes):
+# header, ?, power (0x23=ON, 0x24=OFF), mode, ?, speed, red, green, blue, white, ?, footer
+_STATUS_RESPONSE = struct.Struct(">BxBBxBBBBBxB")
+
 class TrionesMode(Enum):
     """Triones controller modes"""
     STATIC_COLOR = 0x41
@@ -72,6 +109,183 @@ class TrionesStatus:
         """RGBW values as tuple"""
         return (self.red, self.green, self.blue, self.white)
 
+@functools.lru_cache(maxsize=256)
+def rgb_command(red: int, green: int, blue: int) -> bytes:
+    """
+    Build the Triones static RGB command frame
+    
+    Frames are cached, so repeatedly sending the same color does no packing work.
+    
+    Args:
+        red: Red component (0-255)
+        green: Green component (0-255)
+        blue: Blue component (0-255)
+        
+    Returns:
+        bytes: Command frame ready for TrionesController.write_raw()
+    """
+    # Validate input; any bit above 0xFF (including a negative sign) is out of range
+    if (red | green | blue) & ~0xFF:
+        raise ValueError(f"RGB values must be 0-255, got: {red}, {green}, {blue}")
+    
+    # Official Triones RGB command format: 56 RR GG BB 00 F0 AA
+    return _COLOR_FRAME.pack(0x56, red, green, blue, 0x00, 0xF0, 0xAA)
+
+def white_command(intensity: int) -> bytes:
+    """
+    Build the Triones white mode command frame
+    
+    Args:
+        intensity: White intensity (0-255)
+        
+    Returns:
+        bytes: Command frame ready for TrionesController.write_raw()
+    """
+    if intensity & ~0xFF:
+        raise ValueError(f"White intensity must be 0-255, got: {intensity}")
+    
+    # Official Triones white command format: 56 00 00 00 WW 0F AA
+    return _COLOR_FRAME.pack(0x56, 0x00, 0x00, 0x00, intensity, 0x0F, 0xAA)
+
+def _compute_kelvin_rgb(temperature: int) -> Tuple[int, int, int]:
+    """
+    Convert color temperature in Kelvin to RGB values
+    Based on Tanner Helland's algorithm: https://tannerhelland.com/2012/09/18/convert-temperature-rgb-algorithm.html
+    
+    Args:
+        temperature: Color temperature in Kelvin (1000-40000)
+        
+    Returns:
+        Tuple[int, int, int]: RGB values (0-255)
+    """
+    # Clamp temperature to valid range
+    temperature = max(1000, min(40000, temperature))
+    
+    # Convert to temperature / 100 for calculations
+    temp = temperature / 100.0
+    
+    # Calculate red
+    if temp <= 66:
+        red = 255
+    else:
+        red = temp - 60
+        red = 329.698727446 * (red ** -0.1332047592)
+        red = max(0, min(255, red))
+    
+    # Calculate green
+    if temp <= 66:
+        green = temp
+        green = 99.4708025861 * math.log(green) - 161.1195681661
+    else:
+        green = temp - 60
+        green = 288.1221695283 * (green ** -0.0755148492)
+    green = max(0, min(255, green))
+    
+    # Calculate blue
+    if temp >= 66:
+        blue = 255
+    elif temp <= 19:
+        blue = 0
+    else:
+        blue = temp - 10
+        blue = 138.5177312231 * math.log(blue) - 305.0447927307
+        blue = max(0, min(255, blue))
+    
+    return (int(red), int(green), int(blue))
+
+# Packed R, G, B bytes for every whole Kelvin from 1000 to 40000, filled one entry
+# at a time as temperatures are first used. Red never drops below 151 in this
+# range, so a zero red byte marks an entry that hasn't been computed yet.
+_KELVIN_TABLE = bytearray(3 * (40000 - 1000 + 1))
+
+def _kelvin_to_rgb(temperature: int) -> Tuple[int, int, int]:
+    """
+    Convert color temperature in Kelvin to RGB values using a lookup table
+    
+    Args:
+        temperature: Color temperature in Kelvin (1000-40000)
+        
+    Returns:
+        Tuple[int, int, int]: RGB values (0-255)
+    """
+    # Fractional temperatures aren't in the table
+    if not isinstance(temperature, int):
+        return _compute_kelvin_rgb(temperature)
+    
+    temperature = max(1000, min(40000, temperature))
+    i = (temperature - 1000) * 3
+    if not _KELVIN_TABLE[i]:
+        _KELVIN_TABLE[i:i + 3] = bytes(_compute_kelvin_rgb(temperature))
+    return (_KELVIN_TABLE[i], _KELVIN_TABLE[i + 1], _KELVIN_TABLE[i + 2])
+
+@functools.lru_cache(maxsize=256)
+def temperature_command(temperature: int, brightness: float = 1.0, use_white_leds: bool = True) -> bytes:
+    """
+    Build the command frame for a color temperature
+    
+    Frames are cached, so presets and repeated ramps skip the conversion entirely.
+    
+    Neutral/cool temperatures (>= 4000K) use the white LEDs when the color is close
+    to white; everything else is reproduced with the RGB LEDs.
+    
+    Args:
+        temperature: Color temperature in Kelvin (1000-40000)
+        brightness: Overall brightness multiplier (0.0-1.0)
+        use_white_leds: If True, use white LEDs for neutral/cool temps. If False, use RGB only.
+        
+    Returns:
+        bytes: Command frame ready for TrionesController.write_raw()
+    """
+    if not 1000 <= temperature <= 40000:
+        raise ValueError(f"Temperature must be 1000-40000K, got: {temperature}")
+    
+    if not 0.0 <= brightness <= 1.0:
+        raise ValueError(f"Brightness must be 0.0-1.0, got: {brightness}")
+    
+    # Get RGB values for the temperature
+    rgb_r, rgb_g, rgb_b = _kelvin_to_rgb(temperature)
+    
+    # Decide whether to use RGB or White LEDs based on temperature and hardware limitations
+    # Since this controller can't use RGB+White simultaneously, we choose the best option
+    
+    if use_white_leds and temperature >= 4000:
+        # For neutral and cool temperatures, white LEDs are more efficient and accurate
+        # Use white LEDs with slight RGB tint if needed
+        
+        # Calculate how "white" this temperature is
+        rgb_min = min(rgb_r, rgb_g, rgb_b)
+        rgb_max = max(rgb_r, rgb_g, rgb_b)
+        whiteness = rgb_min / rgb_max if rgb_max > 0 else 1.0
+        
+        if whiteness > 0.8:  # Very white/neutral color
+            # Use pure white LEDs for maximum efficiency
+            white_intensity = int(255 * brightness)
+            logger.debug(f"Temperature {temperature}K -> Pure White({white_intensity})")
+            return white_command(white_intensity)
+        else:
+            # Use RGB for colors that are less white (more colored)
+            final_r = int(rgb_r * brightness)
+            final_g = int(rgb_g * brightness) 
+            final_b = int(rgb_b * brightness)
+            logger.debug(f"Temperature {temperature}K -> RGB({final_r}, {final_g}, {final_b})")
+            return rgb_command(final_r, final_g, final_b)
+    else:
+        # For warm temperatures or when white LEDs disabled, use RGB only
+        # Boost brightness slightly to compensate for not using white LEDs
+        brightness_boost = min(1.0, brightness * 1.2)
+        
+        final_r = int(rgb_r * brightness_boost)
+        final_g = int(rgb_g * brightness_boost)
+        final_b = int(rgb_b * brightness_boost)
+        
+        # Ensure values don't exceed 255
+        final_r = min(255, final_r)
+        final_g = min(255, final_g)
+        final_b = min(255, final_b)
+        
+        logger.debug(f"Temperature {temperature}K -> RGB({final_r}, {final_g}, {final_b})")
+        return rgb_command(final_r, final_g, final_b)
+
 class TrionesController:
     """
     Triones RGBW Bluetooth LED Controller
@@ -92,28 +306,74 @@ class TrionesController:
     POWER_ON = 0x23
     POWER_OFF = 0x24
     
-    def __init__(self, device: BLEDevice, auto_connect: bool = True):
+    # Minimum gap between coalesced RGB writes (about one BLE connection interval)
+    COALESCE_INTERVAL = 0.03
+    
+    # Gap between the RGB and white halves of set_rgbw(); raise it (e.g. to 0.1)
+    # on controllers that drop the second write when they arrive back-to-back
+    RGBW_WRITE_DELAY = 0.0
+    
+    # Repeating the same set_temperature() setpoint within this many seconds skips
+    # the BLE write (0 disables); keeps sliders and transitions from resending it
+    DEDUPE_WINDOW = 1.0
+    
+    def __init__(self, device: BLEDevice, auto_connect: bool = True, coalesce_rgb: bool = False,
+                 min_conn_interval_ms: Optional[float] = None, max_conn_interval_ms: Optional[float] = None):
         """
         Initialize Triones controller
         
         Args:
             device: BleakDevice object for the controller
             auto_connect: Whether to automatically connect when needed
+            coalesce_rgb: Queue set_rgb() colors and send only the latest one per
+                          connection interval, dropping stale intermediate colors
+                          (useful for color pickers and animations)
+            min_conn_interval_ms: Preferred minimum BLE connection interval
+            max_conn_interval_ms: Preferred maximum BLE connection interval
+                                  Shorter intervals make commands take effect sooner at
+                                  the cost of power. Only applied on backends that expose
+                                  connection parameters (currently Windows, where the
+                                  range is mapped to the closest system preset and
+                                  the throughput-optimized preset is used if neither
+                                  bound is given).
         """
         self.device = device
+        # Plain copies so logging/repr don't go back through the BLEDevice
+        self._name = device.name or "Unknown Triones"
+        self._address = device.address
         self.auto_connect = auto_connect
+        self.coalesce_rgb = coalesce_rgb
+        self.min_conn_interval_ms = min_conn_interval_ms
+        self.max_conn_interval_ms = max_conn_interval_ms
         self._client: Optional[BleakClient] = None
         self._connected = False
+        self._pending_status: Optional[asyncio.Future] = None
+        self._last_command: Optional[bytes] = None
+        self._last_command_time = 0.0
+        self._write_without_response = True
+        self._write_char_present = True
+        # Resolved characteristic handles, so bleak doesn't look the UUID up on every
+        # call; they fall back to the UUID strings until services are known
+        self._write_char: _Characteristic = self.WRITE_CHARACTERISTIC
+        self._notify_char: Optional[BleakGATTCharacteristic] = None
+        self._notify_chars: List[_Characteristic] = []
+        self._pending_rgb: Optional[bytes] = None
+        # asyncio primitives are created on first use inside the running loop;
+        # on Python < 3.10 they bind to the current loop at construction
+        self._writer_event: Optional[asyncio.Event] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._conn_params_request = None
+        self._connect_lock: Optional[asyncio.Lock] = None
         
     @property
     def name(self) -> str:
         """Controller device name"""
-        return self.device.name or "Unknown Triones"
+        return self._name
     
     @property
     def address(self) -> str:
         """Controller MAC address"""
-        return self.device.address
+        return self._address
     
     @property
     def is_connected(self) -> bool:
@@ -130,103 +390,353 @@ class TrionesController:
         if self.is_connected:
             return True
             
-        try:
-            self._client = BleakClient(self.device.address)
-            await self._client.connect()
-            
-            # Force service discovery - especially important on Windows
-            # Wait a moment for connection to stabilize
-            await asyncio.sleep(0.5)
+        # Serialize connects so concurrent callers don't open two clients
+        async with self._get_connect_lock():
+            if self.is_connected:
+                return True
             
-            # Access services to ensure discovery has happened
-            # On Windows, this might trigger service discovery if not already done
             try:
-                services = self._client.services
-                if services:
-                    service_count = len([s for s in services])
-                    logger.debug(f"Services discovered: {service_count}")
+                self._client = BleakClient(self._address)
+                await self._client.connect()
+                self._apply_connection_parameters()
+                
+                # Wait a moment for the connection to stabilize on Windows; other
+                # backends finish service discovery as part of connect()
+                if _IS_WINDOWS:
+                    await asyncio.sleep(0.5)
+                
+                # Access services to ensure discovery has happened
+                # On Windows, this might trigger service discovery if not already done
+                try:
+                    services = self._client.services
+                    if services:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Services discovered: {len(services.services)}")
                     
-                    # Check if our required service exists
-                    service_found = any(
-                        str(service.uuid).lower() == self.SERVICE_UUID.lower() 
-                        for service in services
-                    )
+                        # Use Write Without Response unless the characteristic doesn't offer it
+                        write_char = services.get_characteristic(self.WRITE_CHARACTERISTIC)
+                        self._write_char_present = write_char is not None
+                        if write_char is not None:
+                            self._write_char = write_char
+                        self._write_without_response = (
+                            write_char is None or "write-without-response" in write_char.properties
+                        )
                     
-                    if not service_found:
-                        logger.warning(f"Required service {self.SERVICE_UUID} not found")
-                        # Try to find any services that might work
-                        for service in services:
-                            logger.debug(f"Available service: {service.uuid}")
-                else:
-                    logger.warning("No services discovered - this may cause write failures")
+                        # Check if our required service exists
+                        if services.get_service(self.SERVICE_UUID) is None:
+                            logger.warning(f"Required service {self.SERVICE_UUID} not found")
+                            # Try to find any services that might work
+                            for service in services:
+                                logger.debug(f"Available service: {service.uuid}")
+                    else:
+                        logger.warning("No services discovered - this may cause write failures")
                     
-            except Exception as service_error:
-                logger.warning(f"Service discovery issue: {service_error}")
-            
-            # Additional wait for Windows stability
-            await asyncio.sleep(0.2)
-            
-            self._connected = True
-            logger.info(f"Connected to {self.name} ({self.address})")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to connect to {self.name}: {e}")
+                except Exception as service_error:
+                    logger.warning(f"Service discovery issue: {service_error}")
+                
+                # Additional wait for Windows stability
+                if _IS_WINDOWS:
+                    await asyncio.sleep(0.2)
+                
+                # Subscribe once for the lifetime of the connection, so status
+                # requests only need to send the query
+                await self._start_notifications()
+                
+                self._last_command = None
+                self._connected = True
+                if self.coalesce_rgb and (self._writer_task is None or self._writer_task.done()):
+                    if self._writer_event is None:
+                        self._writer_event = asyncio.Event()
+                    self._writer_task = asyncio.create_task(self._writer_loop())
+                logger.info(f"Connected to {self._name} ({self._address})")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to connect to {self._name}: {e}")
+                self._connected = False
+                self._clear_gatt_cache()
+                if self._client:
+                    try:
+                        await self._client.disconnect()
+                    except Exception:
+                        pass
+                    self._client = None
+                return False
+    
+    def _get_connect_lock(self) -> asyncio.Lock:
+        """Return the lock serializing connect/disconnect, creating it in the running loop"""
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        return self._connect_lock
+    
+    async def _force_reconnect(self):
+        """Force disconnect and clear connection state for reconnection"""
+        # Hold the connect lock so a concurrent connect()/disconnect() can't
+        # see the client swapped out from under it
+        async with self._get_connect_lock():
             self._connected = False
+            self._clear_gatt_cache()
+            self._release_connection_parameters()
             if self._client:
                 try:
                     await self._client.disconnect()
-                except:
+                except Exception:
                     pass
                 self._client = None
-            return False
-    
-    async def _force_reconnect(self):
-        """Force disconnect and clear connection state for reconnection"""
-        self._connected = False
-        if self._client:
-            try:
-                await self._client.disconnect()
-            except:
-                pass
-            self._client = None
+        
+        # Queued colors belong to the dead connection; connect() starts a new writer
+        await self._stop_writer(flush=False)
     
     async def disconnect(self):
         """Disconnect from the controller"""
-        if self._client and self._connected:
+        if not (self._client and self._connected):
+            # A forced or failed reconnect can leave the writer behind
+            await self._stop_writer(flush=False)
+            return
+        
+        # Flush queued colors before taking the lock; a failed flush may reconnect
+        try:
+            await self._stop_writer()
+        except Exception as e:
+            logger.error(f"Error flushing queued color to {self._name}: {e}")
+        
+        async with self._get_connect_lock():
+            if not (self._client and self._connected):
+                return
             try:
+                await self._stop_notifications()
                 await self._client.disconnect()
-                logger.info(f"Disconnected from {self.name}")
+                logger.info(f"Disconnected from {self._name}")
             except Exception as e:
-                logger.error(f"Error disconnecting from {self.name}: {e}")
+                logger.error(f"Error disconnecting from {self._name}: {e}")
             finally:
+                self._release_connection_parameters()
                 self._connected = False
+                self._clear_gatt_cache()
                 self._client = None
     
+    def _clear_gatt_cache(self):
+        """Forget characteristic handles resolved for the previous connection"""
+        self._write_char = self.WRITE_CHARACTERISTIC
+        self._write_char_present = True
+        self._notify_char = None
+        self._notify_chars = []
+    
+    def _apply_connection_parameters(self):
+        """Request the preferred connection interval from the backend, if supported"""
+        # Without an explicit range, only Windows gets a (throughput-optimized) default
+        if self.min_conn_interval_ms is None and self.max_conn_interval_ms is None and not _IS_WINDOWS:
+            return
+        
+        # Only the WinRT backend exposes connection parameters (as presets)
+        requester = getattr(getattr(self._client, "_backend", None), "_requester", None)
+        if requester is None or not hasattr(requester, "request_preferred_connection_parameters"):
+            logger.debug("Connection interval preference not supported by this backend")
+            return
+        
+        try:
+            try:
+                from winrt.windows.devices.bluetooth import BluetoothLEPreferredConnectionParameters
+            except ImportError:
+                from bleak_winrt.windows.devices.bluetooth import BluetoothLEPreferredConnectionParameters
+            
+            interval = self.max_conn_interval_ms
+            if interval is None:
+                interval = self.min_conn_interval_ms
+            if interval is None or interval <= 15:
+                params = BluetoothLEPreferredConnectionParameters.throughput_optimized
+            elif interval >= 90:
+                params = BluetoothLEPreferredConnectionParameters.power_optimized
+            else:
+                params = BluetoothLEPreferredConnectionParameters.balanced
+            
+            # The preference only holds while the request object is kept open
+            self._conn_params_request = requester.request_preferred_connection_parameters(params)
+            logger.debug(f"Requested connection parameters for {interval if interval is not None else 'default'} ms interval")
+        except Exception as e:
+            logger.debug(f"Could not request connection parameters: {e}")
+    
+    def _release_connection_parameters(self):
+        """Drop any connection parameter request made at connect"""
+        if self._conn_params_request is not None:
+            try:
+                self._conn_params_request.close()
+            except Exception:
+                pass
+            self._conn_params_request = None
+    
+    async def _writer_loop(self):
+        """Send the latest queued RGB command, at most once per connection interval"""
+        while True:
+            await self._writer_event.wait()
+            self._writer_event.clear()
+            command = self._pending_rgb
+            self._pending_rgb = None
+            if command is not None:
+                await self._write_command(command, supersede_queued=False)
+            await asyncio.sleep(self.COALESCE_INTERVAL)
+    
+    async def _stop_writer(self, flush: bool = True):
+        """
+        Stop the coalescing writer
+        
+        Args:
+            flush: Send any color still queued; otherwise it is dropped
+        """
+        if self._writer_task is None:
+            return
+        # The writer itself may end up here via a failed write; it keeps its slot
+        # and carries on once the reconnect it is driving finishes
+        if self._writer_task is asyncio.current_task():
+            return
+        self._writer_task.cancel()
+        try:
+            await self._writer_task
+        except asyncio.CancelledError:
+            pass
+        self._writer_task = None
+        
+        command = self._pending_rgb
+        self._pending_rgb = None
+        if command is not None and flush:
+            await self._write_command(command, supersede_queued=False)
+    
+    def _find_notify_char(self) -> Optional[BleakGATTCharacteristic]:
+        """
+        Find which notify characteristic this controller exposes
+        
+        Returns:
+            BleakGATTCharacteristic: The characteristic, or None if services are unavailable
+        """
+        try:
+            services = self._client.services
+        except Exception as e:
+            logger.debug(f"Services unavailable for notify detection: {e}")
+            return None
+        if not services:
+            return None
+        
+        candidates = (self.NOTIFY_CHARACTERISTIC_1, self.NOTIFY_CHARACTERISTIC_2)
+        indicate_char = None
+        for service in services:
+            for char in service.characteristics:
+                uuid = str(char.uuid).lower()
+                if uuid not in candidates:
+                    continue
+                # Prefer notify over indicate (no confirmation round-trip)
+                if "notify" in char.properties:
+                    return char
+                if indicate_char is None and "indicate" in char.properties:
+                    indicate_char = char
+        return indicate_char
+    
+    async def _start_notifications(self):
+        """Subscribe to status notifications on the notify characteristic"""
+        if self._notify_char is None:
+            self._notify_char = self._find_notify_char()
+        
+        if self._notify_char is not None:
+            chars = [self._notify_char]
+        else:
+            # Unknown layout, try both characteristics the protocol uses
+            chars = [self.NOTIFY_CHARACTERISTIC_1, self.NOTIFY_CHARACTERISTIC_2]
+        
+        # Both CCCD writes go out together rather than one round-trip after the other
+        results = await asyncio.gather(*(self._safe_start_notify(char) for char in chars))
+        self._notify_chars = [char for char in results if char is not None]
+    
+    async def _safe_start_notify(self, char: _Characteristic) -> Optional[_Characteristic]:
+        """Subscribe to one characteristic, returning it on success or None on failure"""
+        try:
+            await self._client.start_notify(char, self._on_notify)
+            return char
+        except Exception as e:
+            logger.debug(f"Could not start notify on {char}: {e}")
+            return None
+    
+    async def _stop_notifications(self):
+        """Unsubscribe from status notifications"""
+        chars, self._notify_chars = self._notify_chars, []
+        await asyncio.gather(*(self._safe_stop_notify(char) for char in chars))
+    
+    async def _safe_stop_notify(self, char: _Characteristic):
+        """Unsubscribe from one characteristic, ignoring failures"""
+        try:
+            await self._client.stop_notify(char)
+        except Exception as e:
+            logger.debug(f"Could not stop notify on {char}: {e}")
+    
+    def _on_notify(self, sender, data):
+        """Store a notification from the controller and wake the waiting request"""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received response: %s", data.hex())
+        
+        # Only a complete status frame answers the request; ignore anything else
+        if (len(data) != _STATUS_RESPONSE.size or data[0] != self.HEADER_MAGIC
+                or data[-1] != self.FOOTER_MAGIC):
+            return
+        
+        pending = self._pending_status
+        if pending is not None and not pending.done():
+            # Copy out of the backend's buffer, which may be reused for the next notification
+            pending.set_result(bytes(data))
+    
     async def _ensure_connected(self) -> bool:
         """Ensure controller is connected"""
         if not self.is_connected and self.auto_connect:
             return await self.connect()
         return self.is_connected
     
-    async def _write_command(self, command: bytes) -> bool:
+    async def _write_command(self, command: bytes, response: bool = False, dedupe: bool = False,
+                             supersede_queued: bool = True) -> bool:
         """
         Write command to controller
         
         Args:
             command: Command bytes to send
+            response: Whether to wait for a write response from the controller.
+                      Control commands are stateless, so by default they are sent
+                      as Write Without Response when the characteristic supports it.
+            dedupe: Skip the write if the same command was sent within DEDUPE_WINDOW.
+                    Only for setpoints where a resend is known to be redundant.
+            supersede_queued: Drop any color still waiting in the coalescing queue.
+                              Only the writer itself and read-only queries pass False.
             
         Returns:
             bool: True if command sent successfully
         """
+        # A direct write replaces whatever color is still queued, so a stale
+        # set_rgb() frame can't land after it
+        if supersede_queued:
+            self._pending_rgb = None
+        
         if not await self._ensure_connected():
             return False
+        
+        # Resolved once at connect; unknown service layouts are assumed to have it
+        if not self._write_char_present:
+            logger.error(f"Write characteristic {self.WRITE_CHARACTERISTIC} not available on {self._name}")
+            return False
+        
+        if (dedupe and command == self._last_command
+                and time.monotonic() - self._last_command_time < self.DEDUPE_WINDOW):
+            return True
+        
+        if not self._write_without_response:
+            response = True
+        
+        # Whatever was sent last is about to be superseded; until this write
+        # completes, nothing may be skipped as a duplicate of it
+        self._last_command = None
             
         try:
-            await self._client.write_gatt_char(self.WRITE_CHARACTERISTIC, command)
-            logger.debug(f"Sent command: {command.hex()}")
+            await self._client.write_gatt_char(self._write_char, command, response=response)
+            self._last_command = command
+            self._last_command_time = time.monotonic()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent command: %s", command.hex())
             
             # On Windows, add small delay after longer commands for processing
-            if platform.system() == "Windows" and len(command) > 4:
+            if _IS_WINDOWS and len(command) > 4:
                 await asyncio.sleep(0.05)
             
             return True
@@ -234,13 +744,16 @@ class TrionesController:
             logger.error(f"Failed to write command {command.hex()}: {e}")
             
             # On Windows, try reconnecting once if write fails
-            if platform.system() == "Windows" and "not connected" in str(e).lower():
+            if _IS_WINDOWS and "not connected" in str(e).lower():
                 logger.info("Attempting reconnection after write failure")
                 await self._force_reconnect()
                 if await self._ensure_connected():
                     try:
-                        await self._client.write_gatt_char(self.WRITE_CHARACTERISTIC, command)
-                        logger.debug(f"Sent command after reconnection: {command.hex()}")
+                        await self._client.write_gatt_char(self._write_char, command, response=response)
+                        self._last_command = command
+                        self._last_command_time = time.monotonic()
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Sent command after reconnection: %s", command.hex())
                         return True
                     except Exception as retry_e:
                         logger.error(f"Retry write failed: {retry_e}")
@@ -257,39 +770,34 @@ class TrionesController:
         if not await self._ensure_connected():
             return None
             
-        response_data = None
-        
-        def notification_handler(sender, data):
-            nonlocal response_data
-            response_data = data
-            logger.debug(f"Received response: {data.hex()}")
+        # Concurrent callers share the query already in flight
+        pending = self._pending_status
+        owner = pending is None or pending.done()
+        if owner:
+            pending = asyncio.get_running_loop().create_future()
+            self._pending_status = pending
         
         try:
-            # Subscribe to notifications
-            for char in [self.NOTIFY_CHARACTERISTIC_1, self.NOTIFY_CHARACTERISTIC_2]:
-                try:
-                    await self._client.start_notify(char, notification_handler)
-                except Exception as e:
-                    logger.debug(f"Could not start notify on {char}: {e}")
+            # Send status request; notifications are already subscribed at connect.
+            # The reply arrives as a notification, so the write itself needs no ACK.
+            if owner and not await self._write_command(_STATUS_CMD, supersede_queued=False):
+                return None
             
-            # Send status request
-            status_command = bytes([0xEF, 0x01, 0x77])
-            if await self._write_command(status_command):
-                # Wait for response
-                await asyncio.sleep(1.5)
-            
-            # Stop notifications
-            for char in [self.NOTIFY_CHARACTERISTIC_1, self.NOTIFY_CHARACTERISTIC_2]:
-                try:
-                    await self._client.stop_notify(char)
-                except:
-                    pass
-                    
-            return response_data
+            # Wait for the response, but no longer than it takes to arrive
+            return await asyncio.wait_for(asyncio.shield(pending), timeout=1.5)
             
+        except asyncio.TimeoutError:
+            logger.debug("Timed out waiting for status response")
+            return None
         except Exception as e:
             logger.error(f"Failed to get status response: {e}")
             return None
+        finally:
+            if owner:
+                if not pending.done():
+                    pending.set_result(None)
+                if self._pending_status is pending:
+                    self._pending_status = None
     
     def _parse_status_response(self, response: bytes) -> Optional[TrionesStatus]:
         """
@@ -301,23 +809,17 @@ class TrionesController:
         Returns:
             TrionesStatus: Parsed status or None if invalid
         """
-        if not response or len(response) != 12:
+        if not response or len(response) != _STATUS_RESPONSE.size:
             logger.error(f"Invalid response length: {len(response) if response else 0}")
             return None
         
-        if response[0] != self.HEADER_MAGIC or response[11] != self.FOOTER_MAGIC:
+        # Parse according to official protocol
+        header, power_status, mode, speed, red, green, blue, white, footer = _STATUS_RESPONSE.unpack(response)
+        
+        if header != self.HEADER_MAGIC or footer != self.FOOTER_MAGIC:
             logger.error("Invalid response magic constants")
             return None
         
-        # Parse according to official protocol
-        power_status = response[2]  # 0x23=ON, 0x24=OFF
-        mode = response[3]          # Mode value
-        speed = response[5]         # Speed parameter
-        red = response[6]           # Red component
-        green = response[7]         # Green component  
-        blue = response[8]          # Blue component
-        white = response[9]         # White component
-        
         is_on = power_status == self.POWER_ON
         
         return TrionesStatus(
@@ -331,18 +833,42 @@ class TrionesController:
             raw_response=response
         )
     
-    async def get_status(self) -> Optional[TrionesStatus]:
+    async def get_status(self, retries: int = 3) -> Optional[TrionesStatus]:
         """
         Get current controller status
         
+        Args:
+            retries: Number of attempts before giving up; missed or malformed
+                     responses are retried with exponential backoff (50ms, 150ms, ...)
+        
         Returns:
             TrionesStatus: Current status or None if failed
         """
-        response = await self._get_status_response()
-        if response:
-            return self._parse_status_response(response)
+        for attempt in range(retries):
+            response = await self._get_status_response()
+            if response:
+                status = self._parse_status_response(response)
+                if status:
+                    return status
+            
+            # A dropped connection won't come back by waiting; don't retry
+            if not self.is_connected or attempt == retries - 1:
+                break
+            await asyncio.sleep(0.05 * (3 ** attempt))
         return None
     
+    async def write_raw(self, command: bytes) -> bool:
+        """
+        Send a prebuilt command frame (e.g. from rgb_command())
+        
+        Args:
+            command: Command bytes to send
+            
+        Returns:
+            bool: True if command sent successfully
+        """
+        return await self._write_command(command)
+    
     async def power_on(self) -> bool:
         """
         Turn controller on
@@ -350,8 +876,9 @@ class TrionesController:
         Returns:
             bool: True if command sent successfully
         """
-        command = bytes([0xCC, self.POWER_ON, 0x33])
-        return await self._write_command(command)
+        # A power transition invalidates the last setpoint, even if this write fails
+        self._last_command = None
+        return await self._write_command(_POWER_ON_CMD)
     
     async def power_off(self) -> bool:
         """
@@ -360,8 +887,9 @@ class TrionesController:
         Returns:
             bool: True if command sent successfully
         """
-        command = bytes([0xCC, self.POWER_OFF, 0x33])
-        return await self._write_command(command)
+        # A power transition invalidates the last setpoint, even if this write fails
+        self._last_command = None
+        return await self._write_command(_POWER_OFF_CMD)
     
     async def set_rgb(self, red: int, green: int, blue: int) -> bool:
         """
@@ -375,13 +903,12 @@ class TrionesController:
         Returns:
             bool: True if command sent successfully
         """
-        # Validate input
-        for val in [red, green, blue]:
-            if not 0 <= val <= 255:
-                raise ValueError(f"RGB values must be 0-255, got: {red}, {green}, {blue}")
-        
-        # Official Triones RGB command format
-        command = bytes([0x56, red, green, blue, 0x00, 0xF0, 0xAA])
+        command = rgb_command(red, green, blue)
+        if self._writer_task is not None:
+            # Latest color wins; the writer task sends it on its next slot
+            self._pending_rgb = command
+            self._writer_event.set()
+            return True
         return await self._write_command(command)
     
     async def set_white(self, intensity: int) -> bool:
@@ -394,12 +921,7 @@ class TrionesController:
         Returns:
             bool: True if command sent successfully
         """
-        if not 0 <= intensity <= 255:
-            raise ValueError(f"White intensity must be 0-255, got: {intensity}")
-        
-        # Official Triones white command format
-        command = bytes([0x56, 0x00, 0x00, 0x00, intensity, 0x0F, 0xAA])
-        return await self._write_command(command)
+        return await self._write_command(white_command(intensity))
     
     async def set_built_in_mode(self, mode: int, speed: int = 1) -> bool:
         """
@@ -422,7 +944,7 @@ class TrionesController:
             raise ValueError(f"Speed must be 1-255, got: {speed}")
         
         # Official Triones built-in mode command format
-        command = bytes([0xBB, mode, speed, 0x44])
+        command = _MODE_FRAME.pack(0xBB, mode, speed, 0x44)
         return await self._write_command(command)
     
     async def set_color_hex(self, hex_color: str) -> bool:
@@ -441,12 +963,10 @@ class TrionesController:
             raise ValueError(f"Invalid hex color format: {hex_color}")
         
         try:
-            red = int(hex_color[0:2], 16)
-            green = int(hex_color[2:4], 16)
-            blue = int(hex_color[4:6], 16)
-            return await self.set_rgb(red, green, blue)
+            red, green, blue = bytes.fromhex(hex_color)
         except ValueError as e:
             raise ValueError(f"Invalid hex color: {hex_color}") from e
+        return await self.set_rgb(red, green, blue)
 
     async def set_rgbw(self, red: int, green: int, blue: int, white: int) -> bool:
         """
@@ -464,10 +984,9 @@ class TrionesController:
         Returns:
             bool: True if command(s) sent successfully
         """
-        # Validate input
-        for val in [red, green, blue, white]:
-            if not 0 <= val <= 255:
-                raise ValueError(f"RGBW values must be 0-255, got: {red}, {green}, {blue}, {white}")
+        # Validate input; any bit above 0xFF (including a negative sign) is out of range
+        if (red | green | blue | white) & ~0xFF:
+            raise ValueError(f"RGBW values must be 0-255, got: {red}, {green}, {blue}, {white}")
         
         # This controller doesn't support combined RGBW commands properly
         # (combined commands only activate the white channel and ignore RGB)
@@ -477,75 +996,28 @@ class TrionesController:
         
         # Handle the case where both RGB and White are 0 (turn off)
         if red == 0 and green == 0 and blue == 0 and white == 0:
-            off_command = bytes([0x56, 0x00, 0x00, 0x00, 0x00, 0xF0, 0xAA])
-            logger.debug(f"Sending OFF command: {off_command.hex()}")
-            return await self._write_command(off_command)
+            logger.debug(f"Sending OFF command: {_RGBW_OFF_CMD.hex()}")
+            return await self._write_command(_RGBW_OFF_CMD)
         
         # Send RGB command first if we have RGB values
         if red > 0 or green > 0 or blue > 0:
-            rgb_command = bytes([0x56, red, green, blue, 0x00, 0xF0, 0xAA])
-            logger.debug(f"Sending RGB command: {rgb_command.hex()}")
-            if not await self._write_command(rgb_command):
+            rgb_frame = rgb_command(red, green, blue)
+            logger.debug(f"Sending RGB command: {rgb_frame.hex()}")
+            if not await self._write_command(rgb_frame):
                 success = False
-                
-            # Small delay after RGB command
-            await asyncio.sleep(0.1)
+            
+            if white > 0 and self.RGBW_WRITE_DELAY:
+                await asyncio.sleep(self.RGBW_WRITE_DELAY)
         
         # Send white command if we have white value
         if white > 0:
-            white_command = bytes([0x56, 0x00, 0x00, 0x00, white, 0x0F, 0xAA])
-            logger.debug(f"Sending White command: {white_command.hex()}")
-            if not await self._write_command(white_command):
+            white_frame = white_command(white)
+            logger.debug(f"Sending White command: {white_frame.hex()}")
+            if not await self._write_command(white_frame):
                 success = False
         
         return success
 
-    def _kelvin_to_rgb(self, temperature: int) -> Tuple[int, int, int]:
-        """
-        Convert color temperature in Kelvin to RGB values
-        Based on Tanner Helland's algorithm: https://tannerhelland.com/2012/09/18/convert-temperature-rgb-algorithm.html
-        
-        Args:
-            temperature: Color temperature in Kelvin (1000-40000)
-            
-        Returns:
-            Tuple[int, int, int]: RGB values (0-255)
-        """
-        # Clamp temperature to valid range
-        temperature = max(1000, min(40000, temperature))
-        
-        # Convert to temperature / 100 for calculations
-        temp = temperature / 100.0
-        
-        # Calculate red
-        if temp <= 66:
-            red = 255
-        else:
-            red = temp - 60
-            red = 329.698727446 * (red ** -0.1332047592)
-            red = max(0, min(255, red))
-        
-        # Calculate green
-        if temp <= 66:
-            green = temp
-            green = 99.4708025861 * math.log(green) - 161.1195681661
-        else:
-            green = temp - 60
-            green = 288.1221695283 * (green ** -0.0755148492)
-        green = max(0, min(255, green))
-        
-        # Calculate blue
-        if temp >= 66:
-            blue = 255
-        elif temp <= 19:
-            blue = 0
-        else:
-            blue = temp - 10
-            blue = 138.5177312231 * math.log(blue) - 305.0447927307
-            blue = max(0, min(255, blue))
-        
-        return (int(red), int(green), int(blue))
-
     async def set_temperature(self, temperature: int, brightness: float = 1.0, use_white_leds: bool = True) -> bool:
         """
         Set color temperature using RGB LEDs and optionally white LEDs for accurate color reproduction
@@ -567,55 +1039,10 @@ class TrionesController:
         Returns:
             bool: True if command sent successfully
         """
-        if not 1000 <= temperature <= 40000:
-            raise ValueError(f"Temperature must be 1000-40000K, got: {temperature}")
-        
-        if not 0.0 <= brightness <= 1.0:
-            raise ValueError(f"Brightness must be 0.0-1.0, got: {brightness}")
-        
-        # Get RGB values for the temperature
-        rgb_r, rgb_g, rgb_b = self._kelvin_to_rgb(temperature)
-        
-        # Decide whether to use RGB or White LEDs based on temperature and hardware limitations
-        # Since this controller can't use RGB+White simultaneously, we choose the best option
-        
-        if use_white_leds and temperature >= 4000:
-            # For neutral and cool temperatures, white LEDs are more efficient and accurate
-            # Use white LEDs with slight RGB tint if needed
-            
-            # Calculate how "white" this temperature is
-            rgb_min = min(rgb_r, rgb_g, rgb_b)
-            rgb_max = max(rgb_r, rgb_g, rgb_b)
-            whiteness = rgb_min / rgb_max if rgb_max > 0 else 1.0
-            
-            if whiteness > 0.8:  # Very white/neutral color
-                # Use pure white LEDs for maximum efficiency
-                white_intensity = int(255 * brightness)
-                logger.debug(f"Temperature {temperature}K -> Pure White({white_intensity})")
-                return await self.set_white(white_intensity)
-            else:
-                # Use RGB for colors that are less white (more colored)
-                final_r = int(rgb_r * brightness)
-                final_g = int(rgb_g * brightness) 
-                final_b = int(rgb_b * brightness)
-                logger.debug(f"Temperature {temperature}K -> RGB({final_r}, {final_g}, {final_b})")
-                return await self.set_rgb(final_r, final_g, final_b)
-        else:
-            # For warm temperatures or when white LEDs disabled, use RGB only
-            # Boost brightness slightly to compensate for not using white LEDs
-            brightness_boost = min(1.0, brightness * 1.2)
-            
-            final_r = int(rgb_r * brightness_boost)
-            final_g = int(rgb_g * brightness_boost)
-            final_b = int(rgb_b * brightness_boost)
-            
-            # Ensure values don't exceed 255
-            final_r = min(255, final_r)
-            final_g = min(255, final_g)
-            final_b = min(255, final_b)
-            
-            logger.debug(f"Temperature {temperature}K -> RGB({final_r}, {final_g}, {final_b})")
-            return await self.set_rgb(final_r, final_g, final_b)
+        # Sliders and transitions often repeat a setpoint; skip resending it
+        return await self._write_command(
+            temperature_command(temperature, brightness, use_white_leds), dedupe=True
+        )
     
     async def test_white_leds(self, intensity: int = 255) -> bool:
         """
@@ -630,7 +1057,8 @@ class TrionesController:
         logger.info(f"Testing white LEDs at intensity {intensity}")
         return await self.set_rgbw(0, 0, 0, intensity)
     
-    async def test_rgbw_formats(self, red: int = 255, green: int = 0, blue: int = 0, white: int = 100) -> bool:
+    async def test_rgbw_formats(self, red: int = 255, green: int = 0, blue: int = 0, white: int = 100,
+                                observe_delay: float = 2.0) -> bool:
         """
         Test different RGBW command formats to find which one works (debug method)
         
@@ -639,120 +1067,239 @@ class TrionesController:
             green: Green component (0-255) 
             blue: Blue component (0-255)
             white: White component (0-255)
+            observe_delay: Seconds to wait after each format to observe its effect (0 to skip)
             
         Returns:
             bool: True if any command sent successfully
         """
         logger.info(f"Testing RGBW formats with R={red}, G={green}, B={blue}, W={white}")
         
-        formats_to_try = [
-            (bytes([0x56, red, green, blue, white, 0xFF, 0xAA]), "0xFF magic"),
-            (bytes([0x56, red, green, blue, white, 0xF0, 0xAA]), "0xF0 magic (RGB-style)"),
-            (bytes([0x56, red, green, blue, white, 0x0F, 0xAA]), "0x0F magic (White-style)"),
-            (bytes([0x56, red, green, blue, white, 0x00, 0xAA]), "0x00 magic"),
-            (bytes([0x56, red, green, blue, white, 0xAA, 0xAA]), "0xAA magic"),
-        ]
+        # One frame template; only the magic byte changes between formats
+        frame = bytearray((0x56, red, green, blue, white, 0x00, 0xAA))
         
-        for command, description in formats_to_try:
+        for magic, description in _RGBW_TEST_MAGICS:
+            frame[5] = magic
+            command = bytes(frame)
             logger.info(f"  Trying {description}: {command.hex()}")
             if await self._write_command(command):
                 logger.info(f"  ✅ {description} sent successfully")
-                await asyncio.sleep(2)  # Wait to observe effect
+                if observe_delay:
+                    await asyncio.sleep(observe_delay)  # Wait to observe effect
             else:
                 logger.error(f"  ❌ {description} failed")
         
         return True
     
     def __str__(self) -> str:
-        return f"TrionesController({self.name}, {self.address})"
+        return f"TrionesController({self._name}, {self._address})"
     
     def __repr__(self) -> str:
-        return f"TrionesController(name='{self.name}', address='{self.address}', connected={self.is_connected})"
+        return f"TrionesController(name='{self._name}', address='{self._address}', connected={self.is_connected})"
+
+def _is_triones_name(name: Optional[str]) -> bool:
+    """Check whether an advertised name belongs to a Triones controller (e.g. "Triones:1205110001A0")"""
+    # Only the prefix-length slice is lowercased, not the whole name
+    return bool(name) and any(name[:len(prefix)].lower() == prefix for prefix in _TRIONES_NAME_PREFIXES)
 
 class TrionesScanner:
     """Scanner for discovering Triones controllers"""
     
+    # Scan results younger than this are reused instead of scanning again
+    SCAN_CACHE_TTL = 5.0
+    
+    # (monotonic timestamp, scan timeout, devices) from the most recent scan; shared
+    # process-wide, so every caller benefits from (and can clear) the same results
+    _last_scan: Optional[Tuple[float, float, List[BLEDevice]]] = None
+    
+    @classmethod
+    async def _scan(cls, timeout: float,
+                    satisfied: Optional[Callable[[List[BLEDevice]], bool]] = None) -> List[BLEDevice]:
+        """
+        Scan for BLE devices, reusing a recent scan if one is still fresh
+        
+        Args:
+            timeout: Discovery timeout in seconds
+            satisfied: Check that the cached devices contain what the caller is
+                       looking for; if it fails, a real scan is run instead
+            
+        Returns:
+            List[BLEDevice]: Devices seen by the scan
+        """
+        cached = cls._cached_scan(timeout)
+        if cached is not None and (satisfied is None or satisfied(cached)):
+            logger.debug("Reusing recent scan results")
+            return cached
+        
+        logger.info(f"Scanning for Triones controllers (timeout: {timeout}s)")
+        devices = await BleakScanner.discover(timeout=timeout)
+        # Only remember scans that found a controller, so a retry loop waiting
+        # for one keeps scanning instead of spinning on an empty cached result
+        if any(_is_triones_name(device.name) for device in devices):
+            cls._last_scan = (time.monotonic(), timeout, list(devices))
+        return devices
+    
+    @classmethod
+    def _cached_scan(cls, timeout: float) -> Optional[List[BLEDevice]]:
+        """
+        Return the most recent scan's devices if it is still fresh
+        
+        Args:
+            timeout: Requested scan timeout; a shorter cached scan may have missed
+                     devices, so it is only reused if it listened at least this long
+            
+        Returns:
+            List[BLEDevice]: Cached devices, or None if a new scan is needed
+        """
+        if cls._last_scan is None:
+            return None
+        timestamp, scan_timeout, devices = cls._last_scan
+        if scan_timeout >= timeout and time.monotonic() - timestamp < cls.SCAN_CACHE_TTL:
+            # A copy, so callers mutating their result can't alter the shared cache
+            return list(devices)
+        return None
+    
+    @classmethod
+    def clear_scan_cache(cls):
+        """Forget cached scan results so the next lookup scans again"""
+        cls._last_scan = None
+    
     @staticmethod
-    async def discover(timeout: float = 10.0, device_names: Optional[List[str]] = None) -> List[TrionesController]:
+    async def discover(timeout: float = 10.0, device_names: Optional[List[str]] = None,
+                       devices: Optional[List[BLEDevice]] = None) -> List[TrionesController]:
         """
         Discover Triones controllers
         
         Args:
             timeout: Discovery timeout in seconds
             device_names: Specific device names to look for (optional)
+            devices: Results of a previous scan() to filter instead of scanning again (optional)
             
         Returns:
             List[TrionesController]: Found controllers
         """
-        logger.info(f"Scanning for Triones controllers (timeout: {timeout}s)")
-        
-        devices = await BleakScanner.discover(timeout=timeout)
+        names = set(device_names) if device_names is not None else None
+        if devices is None:
+            satisfied = None
+            if names is not None:
+                # Only reuse a cached scan that already saw every requested name
+                satisfied = lambda seen: names <= {device.name for device in seen}
+            devices = await TrionesScanner._scan(timeout, satisfied)
         controllers = []
         
         for device in devices:
-            if device.name:
-                # Check if it's a Triones device
-                if "triones" in device.name.lower():
-                    # If specific device names specified, filter by them
-                    if device_names is None or device.name in device_names:
-                        controller = TrionesController(device)
-                        controllers.append(controller)
-                        logger.info(f"Found Triones controller: {device.name} ({device.address})")
+            name = device.name
+            # Check if it's a Triones device
+            if not _is_triones_name(name):
+                continue
+            # If specific device names specified, filter by them
+            if names is not None and name not in names:
+                continue
+            controllers.append(TrionesController(device))
+            logger.debug(f"Found Triones controller: {name} ({device.address})")
         
         logger.info(f"Found {len(controllers)} Triones controller(s)")
         return controllers
     
     @staticmethod
-    async def find_by_name(name: str, timeout: float = 10.0) -> Optional[TrionesController]:
+    async def find_by_name(name: str, timeout: float = 10.0,
+                           devices: Optional[List[BLEDevice]] = None) -> Optional[TrionesController]:
         """
         Find a specific controller by name
         
         Args:
             name: Device name to search for
             timeout: Discovery timeout in seconds
+            devices: Results of a previous scan() to search instead of scanning again (optional)
             
         Returns:
             TrionesController: Found controller or None
         """
-        controllers = await TrionesScanner.discover(timeout=timeout, device_names=[name])
+        controllers = await TrionesScanner.discover(timeout=timeout, device_names=[name], devices=devices)
         return controllers[0] if controllers else None
     
     @staticmethod
-    async def find_by_address(address: str, timeout: float = 10.0) -> Optional[TrionesController]:
+    async def find_by_address(address: str, timeout: float = 10.0,
+                              devices: Optional[List[BLEDevice]] = None) -> Optional[TrionesController]:
         """
         Find a controller by MAC address
         
         Args:
             address: MAC address to search for
             timeout: Discovery timeout in seconds
+            devices: Results of a previous scan() to search instead of scanning again (optional)
             
         Returns:
             TrionesController: Found controller or None
         """
-        devices = await BleakScanner.discover(timeout=timeout)
+        # Check the caller's scan, or else a still-fresh scan of our own
+        device = None
+        seen = devices if devices is not None else TrionesScanner._cached_scan(timeout)
+        if seen is not None:
+            wanted = address.lower()
+            device = next((d for d in seen if d.address.lower() == wanted), None)
         
-        for device in devices:
-            if device.address.lower() == address.lower():
-                if device.name and "triones" in device.name.lower():
-                    return TrionesController(device)
+        if device is None and devices is None:
+            # Returns as soon as the address is seen instead of waiting out the full scan
+            device = await BleakScanner.find_device_by_address(address, timeout=timeout)
+        if device is None:
+            return None
+        
+        if _is_triones_name(device.name):
+            return TrionesController(device)
         
         return None
 
 # Convenience functions
-async def discover_controllers(timeout: float = 10.0) -> List[TrionesController]:
+async def scan(timeout: float = 10.0) -> List[BLEDevice]:
+    """
+    Convenience function to get BLE devices whose results can be shared across the helpers below
+    
+    May return the cached results of a scan from the last TrionesScanner.SCAN_CACHE_TTL
+    seconds instead of scanning again; a fresh scan also refreshes that cache.
+    """
+    return await TrionesScanner._scan(timeout)
+
+async def discover_controllers(timeout: float = 10.0,
+                               devices: Optional[List[BLEDevice]] = None) -> List[TrionesController]:
     """Convenience function to discover all Triones controllers"""
-    return await TrionesScanner.discover(timeout=timeout)
+    return await TrionesScanner.discover(timeout=timeout, devices=devices)
 
-async def connect_by_name(name: str, timeout: float = 10.0) -> Optional[TrionesController]:
+async def connect_many(identifiers: List[str], timeout: float = 10.0,
+                       devices: Optional[List[BLEDevice]] = None) -> List[TrionesController]:
+    """Convenience function to find controllers by name or address in one scan and connect them concurrently"""
+    if devices is None:
+        wanted = {identifier.lower() for identifier in identifiers}
+        
+        def satisfied(seen: List[BLEDevice]) -> bool:
+            """Only reuse a cached scan that already saw every identifier"""
+            found = {device.address.lower() for device in seen}
+            found.update(device.name.lower() for device in seen if device.name)
+            return wanted <= found
+        
+        devices = await TrionesScanner._scan(timeout, satisfied)
+    controllers = await TrionesScanner.discover(timeout=timeout, devices=devices)
+    by_name = {controller.name: controller for controller in controllers}
+    by_address = {controller.address.lower(): controller for controller in controllers}
+    
+    matches = []
+    for identifier in identifiers:
+        controller = by_name.get(identifier) or by_address.get(identifier.lower())
+        if controller is not None and controller not in matches:
+            matches.append(controller)
+    
+    results = await asyncio.gather(*(c.connect() for c in matches), return_exceptions=True)
+    return [c for c, ok in zip(matches, results) if ok is True]
+
+async def connect_by_name(name: str, timeout: float = 10.0,
+                          devices: Optional[List[BLEDevice]] = None) -> Optional[TrionesController]:
     """Convenience function to find and connect to a controller by name"""
-    controller = await TrionesScanner.find_by_name(name, timeout)
-    if controller and await controller.connect():
-        return controller
-    return None
+    controllers = await connect_many([name], timeout, devices)
+    return controllers[0] if controllers else None
 
-async def connect_by_address(address: str, timeout: float = 10.0) -> Optional[TrionesController]:
+async def connect_by_address(address: str, timeout: float = 10.0,
+                             devices: Optional[List[BLEDevice]] = None) -> Optional[TrionesController]:
     """Convenience function to find and connect to a controller by address"""
-    controller = await TrionesScanner.find_by_address(address, timeout)
+    controller = await TrionesScanner.find_by_address(address, timeout, devices)
     if controller and await controller.connect():
         return controller
     return None
\ No newline at end of file